@@ -18,26 +18,34 @@
     4.  DATA QUALITY CHECKS: Enforced checks to ensure only valid business keys and trusted 
         records are maintained in the Silver layer.
     5.  METADATA ENRICHMENT: Added columns like 'load_timestamp' to support data lineage 
-        and auditing.
+        and auditing (filled by the Silver DDL column default at insert time).
     6.  BATCH PROCESSING: Existing Silver tables were truncated and reloaded with clean, 
         trusted data using a controlled batch process.
-    7.  ORCHESTRATION: A central Python orchestrator executed all loads in the correct 
-        dependency order for repeatable data processing.
+    7.  ORCHESTRATION: A central Python orchestrator runs the independent table loads 
+        side by side; each table's truncate and reload commits as a single transaction.
 
 🏗️ ARCHITECTURE OVERVIEW:
     * STRATEGY: Truncate-and-Load for 100% data consistency.
     * TOOLS: Python (Pandas) for logic; SQL Server for storage.
-    * ORCHESTRATION: Modular functions executed in specific dependency order.
+    * ORCHESTRATION: Modular functions, one per table, executed concurrently.
 
 ====================================================================================================
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, engine
 from sqlalchemy import text
 
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed strings for the text columns)
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = object
+
 
 # ========================================================== EXTRACTING DATA FROM BRONZE LAYER ==============================================================================
 
@@ -59,27 +67,53 @@ connection_url = engine.URL.create(
     "mssql+pyodbc", 
     query={"odbc_connect": connection_string}
 )
-db_engine = create_engine(connection_url)
-
-try:
-    # 3. Load tables into separate DataFrames for individual CLEANING
-    print("🔄 Connecting to SQL Server and fetching tables...")
-    
-    customer_info    = pd.read_sql("SELECT * FROM bronze.crm_customer_info", db_engine)
-    product_info     = pd.read_sql("SELECT * FROM bronze.crm_product_info", db_engine)
-    sales_details    = pd.read_sql("SELECT * FROM bronze.crm_sales_details", db_engine)
-    customer_az12    = pd.read_sql("SELECT * FROM bronze.erp_customer_az12", db_engine)
-    location_a101    = pd.read_sql("SELECT * FROM bronze.erp_location_a101", db_engine)
-    product_category = pd.read_sql("SELECT * FROM bronze.erp_product_category", db_engine)
-
-    print("✅ All tables loaded successfully into separate DataFrames.")
-
-   
-    
-except Exception as e:
-    print(f"❌ Connection failed: {e}")
-
-
+# fast_executemany makes pyodbc bind each to_sql batch as one parameter array
+# instead of sending a separate INSERT round-trip per row
+db_engine = create_engine(connection_url, fast_executemany=True)
+
+# 3. Rows fetched per fetchmany() call when reading large bronze tables in chunks
+READ_CHUNKSIZE = 100_000
+# Rows per fast_executemany batch when writing to silver
+WRITE_CHUNKSIZE = 10_000
+
+
+
+# ========================================================== STANDARDIZATION RULES ==============================================================================
+
+# Lookups are keyed on the trimmed, upper-cased source value
+MARITAL_STATUS_MAP = {'M': 'Married', 'MARRIED': 'Married', 'S': 'Single', 'SINGLE': 'Single'}
+GENDER_MAP         = {'M': 'Male', 'MALE': 'Male', 'F': 'Female', 'FEMALE': 'Female'}
+PRODUCT_LINE_MAP   = {
+    'M': 'Mountain', 'MOUNTAIN': 'Mountain',
+    'R': 'Road', 'ROAD': 'Road',
+    'S': 'Other Sales', 'OTHER SALES': 'Other Sales',
+    'T': 'Touring', 'TOURING': 'Touring'
+}
+COUNTRY_MAP        = {
+    'US': 'United States',
+    'USA': 'United States',
+    'DE': 'Germany',
+    '': 'Unknown',
+    'FEMALE': 'Unknown'   # invalid value, treated as unknown
+}
+
+
+def standardize(col, mapping, keep_unmapped=False):
+    # Low-cardinality column: store it as a category so trimming, upper-casing and the lookup
+    # run once per distinct value instead of once per row.
+    # Unmapped values become 'Unknown', or are title-cased when keep_unmapped is set.
+    col = col.astype('category')
+    standardized = []
+    for value in col.cat.categories:
+        key = value.strip().upper()
+        standardized.append(mapping.get(key, key.title() if keep_unmapped else 'Unknown'))
+    # Missing values carry code -1, which picks this trailing entry - no separate fillna pass
+    standardized.append('Unknown')
+    categories, remap = np.unique(standardized, return_inverse=True)
+    return pd.Series(
+        pd.Categorical.from_codes(remap[col.cat.codes.to_numpy()], categories),
+        index=col.index
+    )
 
 
 # ========================================================== CLEANING  DATA ==============================================================================
@@ -88,7 +122,12 @@ except Exception as e:
 
 def load_crm_customer_info(engine):
     try:
-        customer_info    = pd.read_sql("SELECT * FROM bronze.crm_customer_info", db_engine)
+        customer_info = pd.read_sql(
+            "SELECT cust_id, cst_key, cst_firstname, cst_lastname, cst_marital_status, cst_gndr, cst_create_date "
+            "FROM bronze.crm_customer_info",
+            engine,
+            dtype={col: STRING_DTYPE for col in ['cst_key', 'cst_firstname', 'cst_lastname', 'cst_marital_status', 'cst_gndr']}
+        )
         # 1. Drop invalid business keys first
         customer_info = customer_info.dropna(subset=['cust_id'])
         
@@ -96,14 +135,17 @@ def load_crm_customer_info(engine):
         customer_info['cst_create_date'] = pd.to_datetime(
             customer_info['cst_create_date'],
             errors='coerce'
-        ).dt.date
+        )
         
-        # 3. Sort and deduplicate (keep latest)
-        customer_info = (
-            customer_info
-            .sort_values(by=['cust_id', 'cst_create_date'], ascending=[True, False])
-            .drop_duplicates(subset='cust_id', keep='first')
+        # 3. Deduplicate (keep latest) - one hash pass per cust_id instead of sorting the whole frame;
+        #    ranked on the int64 view of the dates, where NaT is the smallest value, so a dated
+        #    record always wins and no placeholder date has to fit the column's resolution
+        latest = (
+            pd.Series(customer_info['cst_create_date'].to_numpy().view('i8'), index=customer_info.index)
+            .groupby(customer_info['cust_id'])
+            .idxmax()
         )
+        customer_info = customer_info.loc[latest]
         
         # 4. Clean names
         customer_info['cst_firstname'] = (
@@ -119,49 +161,27 @@ def load_crm_customer_info(engine):
         )
         
         # 5. Clean marital status
-        customer_info['cst_marital_status'] = (
-            customer_info['cst_marital_status']
-            .str.upper()
-            .str.strip()
-            .replace({
-                'M': 'Married',
-                'MARRIED': 'Married',
-                'S': 'Single',
-                'SINGLE': 'Single'
-            })
-            .fillna('Unknown')
-        )
+        customer_info['cst_marital_status'] = standardize(customer_info['cst_marital_status'], MARITAL_STATUS_MAP)
         
         # 6. Clean gender
-        customer_info['cst_gndr'] = (
-            customer_info['cst_gndr']
-            .str.upper()
-            .str.strip()
-            .replace({
-                'M': 'Male',
-                'MALE': 'Male',
-                'F': 'Female',
-                'FEMALE': 'Female'
-            })
-            .fillna('Unknown')
-        )
+        customer_info['cst_gndr'] = standardize(customer_info['cst_gndr'], GENDER_MAP)
         
         # 7. Reset index at the end
         customer_info = customer_info.reset_index(drop=True)
-        customer_info['load_timestamp'] = pd.Timestamp.now()
     # '========================================================== complete cleaning crm_customer_info =================================='
         
             #=========================== truncating table crm_customer_info =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.crm_customer_info"))
-         #=========================== loading to silver layer =========================================#
-        customer_info.to_sql(
-            'crm_customer_info',
-            engine,
-            schema='silver',
-            if_exists='append',
-            index=False
-        )
+          #=========================== loading to silver layer =========================================#
+            customer_info.to_sql(
+                'crm_customer_info',
+                conn,
+                schema='silver',
+                if_exists='append',
+                index=False,
+                chunksize=WRITE_CHUNKSIZE
+            )
         print("✅ Loaded silver.crm_customer_info")
     except Exception as e :
        print(f"❌ Failed loading {e}")
@@ -176,22 +196,32 @@ def load_crm_customer_info(engine):
 # '==========================================================  CLEANING crm_product_info =================================='
 def load_crm_product_info(engine):
     try:
-        product_info  = pd.read_sql("SELECT * FROM bronze.crm_product_info", db_engine)
+        product_info = pd.read_sql(
+            "SELECT prd_id, prd_key, prd_nm, prd_cost, prd_line, prd_start_dt "
+            "FROM bronze.crm_product_info",
+            engine,
+            dtype={col: STRING_DTYPE for col in ['prd_key', 'prd_nm', 'prd_line']}
+        )
         # 1. Drop invalid business keys
         product_info = product_info.dropna(subset=['prd_key'])
         
         # 2. Convert dates
-        product_info['prd_start_dt'] = pd.to_datetime(product_info['prd_start_dt'], errors='coerce').dt.date
-        product_info['prd_end_dt']   = pd.to_datetime(product_info['prd_end_dt'], errors='coerce').dt.date
+        #    (prd_end_dt is not read from bronze; it is always derived from the next start date below)
+        product_info['prd_start_dt'] = pd.to_datetime(product_info['prd_start_dt'], errors='coerce')
         
         # 7. Sort for SCD logic
         product_info = product_info.sort_values(['prd_key', 'prd_start_dt'])
         
-        # 8. Derive end date
-        product_info['prd_end_dt'] = (
-            product_info
-            .groupby('prd_key')['prd_start_dt']
-            .shift(-1) - pd.Timedelta(days=1)
+        # 8. Derive end date - once sorted, the next version of a product is simply the next row,
+        #    unless that row already belongs to another prd_key
+        keys   = product_info['prd_key'].to_numpy()
+        starts = product_info['prd_start_dt'].to_numpy()
+        last_version = keys != np.roll(keys, -1)
+        last_version[-1:] = True
+        product_info['prd_end_dt'] = np.where(
+            last_version,
+            np.datetime64('NaT'),
+            np.roll(starts, -1) - np.timedelta64(1, 'D')
         )
         
         
@@ -201,9 +231,6 @@ def load_crm_product_info(engine):
             .str[:5]
             .str.replace('-', '_', regex=False)
         )
-        ## shifting category_id column from last to 2nd position 
-        col_series = product_info.pop('category_id')
-        product_info.insert(2, 'category_id', col_series)
         
         # 4. Extract actual product key
         product_info['prd_key'] = product_info['prd_key'].str[6:]
@@ -212,39 +239,24 @@ def load_crm_product_info(engine):
         product_info['prd_cost'] = product_info['prd_cost'].fillna(0)
         
         # 6. Standardize product line
-        product_info['prd_line'] = (
-            product_info['prd_line']
-            .str.upper()
-            .str.strip()
-            .replace({
-                'M': 'Mountain',
-                'MOUNTAIN': 'Mountain',
-                'R': 'Road',
-                'ROAD': 'Road',
-                'S': 'Other Sales',
-                'OTHER SALES': 'Other Sales',
-                'T': 'Touring',
-                'TOURING': 'Touring'
-            })
-            .fillna('Unknown')
-        )
+        product_info['prd_line'] = standardize(product_info['prd_line'], PRODUCT_LINE_MAP)
 
 
 # 9. Reset index
 # product_info = product_info.reset_index(drop=True)
 
-        product_info['load_timestamp'] = pd.Timestamp.now()
         #=========================== truncating table crm_product_info =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.crm_product_info"))
-        #=========================== loading to silver layer =========================================#
-        product_info.to_sql(
-            'crm_product_info',
-            engine,
-            schema='silver',
-            if_exists='append',
-            index=False
-        )
+          #=========================== loading to silver layer =========================================#
+            product_info.to_sql(
+                'crm_product_info',
+                conn,
+                schema='silver',
+                if_exists='append',
+                index=False,
+                chunksize=WRITE_CHUNKSIZE
+            )
         print("✅ Loaded silver.crm_product_info")
     except Exception as e :
         print(f"❌ Failed loading {e}")
@@ -258,57 +270,74 @@ def load_crm_product_info(engine):
 # '========================================================== CLEANING crm_sales_details =================================='
 def load_crm_sales_details(engine):
     try:
-        sales_details    = pd.read_sql("SELECT * FROM bronze.crm_sales_details", db_engine)
         def clean_yyyymmdd(col):
-            col = col.astype(str).str.split('.').str[0] # Handle cases like '20230101.0'
-            col = np.where(col.str.len() != 8, None, col)
-            return pd.to_datetime(col, format='%Y%m%d', errors='coerce')
-        
+            col = pd.to_numeric(col, errors='coerce')
+            col = col.where((col >= 10000101) & (col <= 99991231)) # anything that is not 8 digits becomes NaN
+            # Split the number arithmetically instead of round-tripping through strings
+            return pd.to_datetime(
+                pd.DataFrame({'year': col // 10000, 'month': col // 100 % 100, 'day': col % 100}),
+                errors='coerce'
+            )
+
+        def clean_sales_details(sales_details):
             # Apply the CLEANING
-        sales_details['sls_order_dt'] = clean_yyyymmdd(sales_details['sls_order_dt'])
-        sales_details['sls_ship_dt']  = clean_yyyymmdd(sales_details['sls_ship_dt'])
-        sales_details['sls_due_dt']   = clean_yyyymmdd(sales_details['sls_due_dt'])
-        
-        
-        
-        # ===========================================================================
-        # ===========================================================================
-        
-        # We pre-fill quantity and price with 0 during the calculation to prevent new NaNs
-        calc_sales = sales_details['sls_quantity'].fillna(0) * sales_details['sls_price'].fillna(0).abs()
-        
-        sales_condition = (
-            sales_details['sls_sales'].isna() | 
-            (sales_details['sls_sales'] <= 0) | 
-            (sales_details['sls_sales'] != calc_sales)
-        )
-        
-        sales_details['sls_sales'] = np.where(sales_condition, calc_sales, sales_details['sls_sales'])
-        
-        # 2. SLS_PRICE CLEANSING
-        # We use replace(0, np.nan) to mimic SQL's NULLIF and prevent division by zero
-        price_condition = (sales_details['sls_price'].isna()) | (sales_details['sls_price'] <= 0)
-        
-        calc_price = sales_details['sls_sales'] / sales_details['sls_quantity'].replace(0, np.nan)
-        
-        sales_details['sls_price'] = np.where(price_condition, calc_price, sales_details['sls_price'])
-        
-        # 3. FINAL SAFETY STEP (Removes the remaining 7 nulls)
-        # Fill any remaining NaNs (caused by 0/0 or initial nulls not caught by conditions)
-        sales_details[['sls_sales', 'sls_price']] = sales_details[['sls_sales', 'sls_price']].fillna(0)
-    
-        sales_details['load_timestamp'] = pd.Timestamp.now()
+            sales_details['sls_order_dt'] = clean_yyyymmdd(sales_details['sls_order_dt'])
+            sales_details['sls_ship_dt']  = clean_yyyymmdd(sales_details['sls_ship_dt'])
+            sales_details['sls_due_dt']   = clean_yyyymmdd(sales_details['sls_due_dt'])
+            
+            
+            
+            # ===========================================================================
+            # ===========================================================================
+            
+            # Single pass over plain numpy arrays instead of building a temporary Series per rule.
+            # We pre-fill quantity and price with 0 during the calculation to prevent new NaNs
+            quantity = sales_details['sls_quantity'].to_numpy(dtype='float64', na_value=np.nan)
+            price    = sales_details['sls_price'].to_numpy(dtype='float64', na_value=np.nan)
+            
+            # 1. SLS_SALES CLEANSING
+            # A missing, non-positive or inconsistent sls_sales is replaced by quantity * |price|,
+            # and a consistent one already equals it, so the cleansed value is always that product
+            # (which is why the bronze sls_sales column is not even read)
+            sales = np.nan_to_num(quantity) * np.abs(np.nan_to_num(price))
+            
+            # 2. SLS_PRICE CLEANSING
+            # Division by a 0 or missing quantity yields NaN, mimicking SQL's NULLIF
+            with np.errstate(divide='ignore', invalid='ignore'):
+                price = np.where(price > 0, price, sales / quantity)
+            
+            # 3. FINAL SAFETY STEP
+            # Fill any remaining NaNs (caused by 0/0 or initial nulls not caught by conditions)
+            sales_details['sls_sales'] = sales
+            sales_details['sls_price'] = np.nan_to_num(price, nan=0.0)
+        
+            return sales_details
+
            #=========================== truncating table crm_sales_details =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.crm_sales_details"))
-         #=========================== loading to silver layer =========================================#
-        sales_details.to_sql(
-            'crm_sales_details',
-            engine,
-            schema='silver',
-            if_exists='append',
-            index=False
-        )
+          #=========================== streaming, cleaning and loading chunk by chunk =========================================#
+            # Every rule above is row-local, so the fact table never has to be held in memory at once:
+            # pandas pulls READ_CHUNKSIZE rows at a time with fetchmany() from pyodbc's forward-only
+            # cursor on a separate read connection, while every chunk lands in this one transaction
+            with engine.connect() as source:
+                chunks = pd.read_sql(
+                    "SELECT sls_ord_num, sls_prd_key, sls_cust_id, sls_order_dt, sls_ship_dt, sls_due_dt, "
+                    "sls_quantity, sls_price "
+                    "FROM bronze.crm_sales_details",
+                    source,
+                    chunksize=READ_CHUNKSIZE,
+                    dtype={col: STRING_DTYPE for col in ['sls_ord_num', 'sls_prd_key']}
+                )
+                for sales_details in chunks:
+                    clean_sales_details(sales_details).to_sql(
+                        'crm_sales_details',
+                        conn,
+                        schema='silver',
+                        if_exists='append',
+                        index=False,
+                        chunksize=WRITE_CHUNKSIZE
+                    )
         print("✅ Loaded silver.crm_sales_details")
     except Exception as e :
         print(f"❌ Failed loading {e}")
@@ -321,7 +350,11 @@ def load_crm_sales_details(engine):
 
 def load_erp_customer_az12(engine):
     try:
-        customer_az12    = pd.read_sql("SELECT * FROM bronze.erp_customer_az12", db_engine)
+        customer_az12 = pd.read_sql(
+            "SELECT cid, bdate, gen FROM bronze.erp_customer_az12",
+            engine,
+            dtype={col: STRING_DTYPE for col in ['cid', 'gen']}
+        )
                 
                 # ---------- basic inspection ----------
                 # print(customer_az12.info())
@@ -334,53 +367,40 @@ def load_erp_customer_az12(engine):
         customer_az12 = customer_az12.drop_duplicates(subset=['cid'])
                 
                 # ---------- clean cid ----------
-        customer_az12['cid'] = np.where(
-                    customer_az12['cid'].str.startswith('NAS'),
-                    customer_az12['cid'].str[3:],
-                    customer_az12['cid']
-                )
+        customer_az12['cid'] = customer_az12['cid'].str.removeprefix('NAS')
                 
                 # ---------- convert birth date ----------
-        customer_az12['bdate'] = pd.to_datetime(
+        bdate = pd.to_datetime(
                     customer_az12['bdate'],
                     errors='coerce'
-                ).dt.date
+                ).to_numpy()
                 
                 # ---------- remove future dates ----------
-        today = pd.Timestamp.now().date()
+                # kept as datetime64 so this is one int64 comparison instead of per-row date objects
+        today = np.datetime64('today')
         
-        customer_az12.loc[customer_az12['bdate'] > today, 'bdate'] = pd.NaT
+        customer_az12['bdate'] = np.where(bdate > today, np.datetime64('NaT'), bdate)
                 
                 # ---------- clean gender ----------
-        customer_az12['gen'] = (
-                    customer_az12['gen']
-                    .str.strip()
-                    .str.upper()
-                    .replace({
-                        'M': 'Male',
-                        'MALE': 'Male',
-                        'F': 'Female',
-                        'FEMALE': 'Female',
-                        'UNKNOWN': 'Unknown',
-                        '': 'Unknown'
-                    })
-                    .fillna('Unknown')
-                )
+        customer_az12['gen'] = standardize(customer_az12['gen'], GENDER_MAP)
                 
                 # ---------- reset index ----------
         customer_az12 = customer_az12.reset_index(drop=True)
+        # Set explicitly: earlier runs recreated this table through pandas without the DDL's
+        # load_timestamp default, so existing databases cannot rely on it
         customer_az12['load_timestamp'] = pd.Timestamp.now()
        #=========================== truncating table erp_customer_az12 =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.erp_customer_az12"))
-           #=========================== loading to silver layer =========================================#
-        customer_az12.to_sql(
-            'erp_customer_az12',
-            engine,
-            schema='silver',
-            if_exists='replace',
-            index=False
-        )
+          #=========================== loading to silver layer =========================================#
+            customer_az12.to_sql(
+                'erp_customer_az12',
+                conn,
+                schema='silver',
+                if_exists='append',
+                index=False,
+                chunksize=WRITE_CHUNKSIZE
+            )
         print("✅ Loaded silver.erp_customer_az12")
     except Exception as e :
         print(f"❌ Failed loading {e}") 
@@ -398,7 +418,11 @@ def load_erp_customer_az12(engine):
 def load_erp_location_a101(engine):
     try:
         
-        location_a101    = pd.read_sql("SELECT * FROM bronze.erp_location_a101", db_engine)
+        location_a101 = pd.read_sql(
+            "SELECT cid, cntry FROM bronze.erp_location_a101",
+            engine,
+            dtype={col: STRING_DTYPE for col in ['cid', 'cntry']}
+        )
         # ---------- basic inspection ----------
         # print(location_a101.info())
         
@@ -412,34 +436,22 @@ def load_erp_location_a101(engine):
         location_a101['cid'] = location_a101['cid'].str.replace('-','',regex=False)
         
         # ---------- clean country ----------
-        location_a101['cntry'] = (
-            location_a101['cntry']
-            .str.strip()
-            .str.upper()
-            .replace({
-                'US': 'United States',
-                'USA': 'United States',
-                'DE': 'Germany',
-                '': 'Unknown',
-                'FEMALE': 'Unknown'   # invalid value, treated as unknown
-            }).str.title()
-            .fillna('Unknown')
-        )
+        location_a101['cntry'] = standardize(location_a101['cntry'], COUNTRY_MAP, keep_unmapped=True)
         
         # ---------- reset index ----------
         location_a101 = location_a101.reset_index(drop=True)
-        location_a101['load_timestamp'] = pd.Timestamp.now()
            #=========================== truncating table erp_location_a101 =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.erp_location_a101"))
           #=========================== loading to silver layer =========================================#
-        location_a101.to_sql(
-            'erp_location_a101',
-            engine,
-            schema='silver',
-            if_exists='append',
-            index=False
-        )
+            location_a101.to_sql(
+                'erp_location_a101',
+                conn,
+                schema='silver',
+                if_exists='append',
+                index=False,
+                chunksize=WRITE_CHUNKSIZE
+            )
         print("✅ Loaded silver.erp_location_a101")
     except Exception as e :
         print(f"❌ Failed loading {e}")
@@ -450,26 +462,17 @@ def load_erp_location_a101(engine):
         # '========================================================== CLEANING erp_product_category =================================='
 def load_erp_product_category(engine):
     try:
-        
-        product_category = pd.read_sql("SELECT * FROM bronze.erp_product_category", db_engine)
-        # ---------- basic inspection ----------
-        # print(product_category.info())
-        # ---------- checking duplicate key ----------
-        product_category['id'].duplicated().sum()
-        # ---------- checking null ----------
-        product_category.isnull().sum()
-        product_category['load_timestamp'] = pd.Timestamp.now()
+        # ---------- no cleansing rules apply to this table ----------
+        # The rows are copied bronze -> silver inside SQL Server instead of round-tripping
+        # through pandas; load_timestamp is filled by the column default.
           #=========================== truncating table erp_product_category =========================================#
         with engine.begin() as conn:
             conn.execute(text("TRUNCATE TABLE silver.erp_product_category"))
           #=========================== loading to silver layer =========================================#
-        product_category.to_sql(
-            'erp_product_category',
-            engine,
-            schema='silver',
-            if_exists='append',
-            index=False
-        )
+            conn.execute(text(
+                "INSERT INTO silver.erp_product_category WITH (TABLOCK) (id, cat, subcat, maintenance) "
+                "SELECT id, cat, subcat, maintenance FROM bronze.erp_product_category"
+            ))
         print("✅ Loaded silver.erp_product_category")
     except Exception as e :
         print(f"❌ Failed loading {e}")
@@ -485,27 +488,34 @@ def main(engine):
     try:
         print("🚀 Starting Silver layer load")
 
-        # ---------- CRM ----------
-        print("➡ Loading CRM customer info")
-        load_crm_customer_info(engine)
-
-        print("➡ Loading CRM product info")
-        load_crm_product_info(engine)
-        
-        print("➡ Loading CRM sales details")
-        load_crm_sales_details(engine)
-
-        # ---------- ERP ----------
-        print("➡ Loading ERP customer AZ12")
-        load_erp_customer_az12(engine)
-
-        print("➡ Loading ERP location A101")
-        load_erp_location_a101(engine)
-
-        print("➡ Loading ERP product category")
-        load_erp_product_category(engine)
-
-      
+        # Fail fast: one connectivity check up front instead of every load failing on its own
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as e:
+            print(f"❌ Connection failed: {e}")
+            raise SystemExit(1)
+
+        # Each load truncates and fills only its own silver table, so the six loads run
+        # side by side; every worker checks out its own connection from the engine's pool
+        loads = [
+            # ---------- CRM ----------
+            ("CRM customer info",      load_crm_customer_info),
+            ("CRM product info",       load_crm_product_info),
+            ("CRM sales details",      load_crm_sales_details),
+            # ---------- ERP ----------
+            ("ERP customer AZ12",      load_erp_customer_az12),
+            ("ERP location A101",      load_erp_location_a101),
+            ("ERP product category",   load_erp_product_category),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(loads)) as executor:
+            futures = []
+            for name, load in loads:
+                print(f"➡ Loading {name}")
+                futures.append(executor.submit(load, engine))
+            for future in futures:
+                future.result()
 
         print("✅ Silver layer load completed successfully")
 